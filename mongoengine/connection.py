@@ -274,6 +274,11 @@ def disconnect(alias=DEFAULT_CONNECTION_NAME):
     """Close the connection with a given alias."""
     from mongoengine import Document
     from mongoengine.base.common import _get_documents_by_db
+    from mongoengine.mongodb_support import (
+        _invalidate_mongodb_version_cache,
+    )
+
+    _invalidate_mongodb_version_cache(alias)
 
     connection = _connections.pop(alias, None)
     if connection:
@@ -470,6 +475,11 @@ def connect(db=None, alias=DEFAULT_CONNECTION_NAME, **kwargs):
             ).format(alias)
             raise ConnectionFailure(err_msg)
     else:
+        from mongoengine.mongodb_support import (
+            _invalidate_mongodb_version_cache,
+        )
+
+        _invalidate_mongodb_version_cache(alias)
         register_connection(alias, db, **kwargs)
 
     return get_connection(alias)
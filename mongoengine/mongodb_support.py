@@ -2,7 +2,10 @@
 Helper functions, constants, and types to aid with MongoDB version support
 """
 
-from mongoengine.connection import get_connection
+from mongoengine.connection import (
+    DEFAULT_CONNECTION_NAME,
+    get_connection,
+)
 
 # Constant that can be used to compare the version retrieved with
 # get_mongodb_version()
@@ -14,11 +17,56 @@ MONGODB_60 = (6, 0)
 MONGODB_70 = (7, 0)
 MONGODB_80 = (8, 0)
 
+# Server versions retrieved with get_mongodb_version(), keyed by connection alias
+_MONGODB_VERSION_CACHE = {}
+# Attribute holding the server version on the client objects
+_CLIENT_VERSION_ATTR = "_mongoengine_server_version"
 
-def get_mongodb_version():
-    """Return the version of the default connected mongoDB (first 2 digits)
 
+def get_mongodb_version(alias=DEFAULT_CONNECTION_NAME):
+    """Return the version of the connected mongoDB (first 2 digits)
+
+    The version is only retrieved from the server on the first call for
+    a given alias, subsequent calls use a cached value until the alias
+    gets disconnected. The version is also stored on the client so that
+    aliases sharing the same client don't query the server again.
+
+    :param alias: the alias of the connection to inspect
     :return: tuple(int, int)
     """
-    version_list = get_connection().server_info()["versionArray"][:2]  # e.g: (3, 2)
-    return tuple(version_list)
+    try:
+        return _MONGODB_VERSION_CACHE[alias]
+    except KeyError:
+        pass
+
+    conn = get_connection(alias)
+    # Read the instance __dict__ rather than using getattr, as some clients
+    # (e.g. mongomock) return a Database for unknown attributes
+    version = vars(conn).get(_CLIENT_VERSION_ATTR)
+    if version is None:
+        version_list = conn.server_info()["versionArray"][:2]  # e.g: (3, 2)
+        version = tuple(version_list)
+        setattr(conn, _CLIENT_VERSION_ATTR, version)
+
+    _MONGODB_VERSION_CACHE[alias] = version
+    return version
+
+
+def get_cached_mongodb_version(alias=DEFAULT_CONNECTION_NAME):
+    """Return the version of the connected mongoDB if it was already
+    retrieved with get_mongodb_version(), None otherwise.
+
+    Unlike get_mongodb_version(), this never queries the server.
+
+    :param alias: the alias of the connection to inspect
+    :return: tuple(int, int) or None
+    """
+    return _MONGODB_VERSION_CACHE.get(alias)
+
+
+def _invalidate_mongodb_version_cache(alias=None):
+    """Drop the cached server version of an alias (or of all aliases if None)"""
+    if alias is None:
+        _MONGODB_VERSION_CACHE.clear()
+    else:
+        _MONGODB_VERSION_CACHE.pop(alias, None)
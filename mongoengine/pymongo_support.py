@@ -3,30 +3,53 @@ Helper functions, constants, and types to aid with PyMongo support.
 """
 
 import pymongo
-from bson import binary, json_util
+from bson import json_util
 from pymongo.errors import OperationFailure
 
 from mongoengine import connection
 
-PYMONGO_VERSION = tuple(pymongo.version_tuple[:2])
+__all__ = (
+    "LEGACY_JSON_OPTIONS",
+    "PYMONGO_VERSION",
+    "count_documents",
+    "list_collection_names",
+)
+
+_PYMONGO_MAJOR, _PYMONGO_MINOR = pymongo.version_tuple[:2]
+PYMONGO_VERSION = (_PYMONGO_MAJOR, _PYMONGO_MINOR)
+
+# Version gates, evaluated once at import time
+_PYMONGO_GE_40 = _PYMONGO_MAJOR >= 4
+
+# Shared, read-only JSONOptions used by to_json/from_json when the caller
+# doesn't provide json_options. It is built once at import time and must not
+# be mutated. This will be changed to UuidRepresentation.UNSPECIFIED in a
+# future (breaking) release.
+if _PYMONGO_GE_40:
+    from bson.binary import UuidRepresentation
 
-# This will be changed to UuidRepresentation.UNSPECIFIED in a future
-# (breaking) release.
-if PYMONGO_VERSION >= (4,):
     LEGACY_JSON_OPTIONS = json_util.LEGACY_JSON_OPTIONS.with_options(
-        uuid_representation=binary.UuidRepresentation.PYTHON_LEGACY,
+        uuid_representation=UuidRepresentation.PYTHON_LEGACY,
     )
 else:
     LEGACY_JSON_OPTIONS = json_util.DEFAULT_JSON_OPTIONS
 
 
-def count_documents(
-    collection, filter, skip=None, limit=None, hint=None, collation=None
-):
-    """Pymongo>3.7 deprecates count in favour of count_documents"""
-    if limit == 0:
-        return 0  # Pymongo raises an OperationFailure if called with limit=0
+# Options supported by estimated_document_count
+_ALLOWED_EST_KEYS = frozenset(("max_time_ms",))
+
+# listCollections filter excluding the system collections on the server side
+_NON_SYSTEM_COLLECTIONS_FILTER = {"name": {"$regex": r"^(?!system\.)"}}
+
+# OperationFailure messages raised by count_documents for operators that used
+# to work with the deprecated Cursor.count
+_COUNT_FALLBACK_MSGS = (
+    "$geoNear, $near, and $nearSphere are not allowed in this context",
+    "$where is not allowed in this context",
+)
 
+
+def _get_count_kwargs(skip=None, limit=None, hint=None, collation=None):
     kwargs = {}
     if skip is not None:
         kwargs["skip"] = skip
@@ -36,34 +59,11 @@ def count_documents(
         kwargs["hint"] = hint
     if collation is not None:
         kwargs["collation"] = collation
+    return kwargs
 
-    # count_documents appeared in pymongo 3.7
-    if PYMONGO_VERSION >= (3, 7):
-        try:
-            is_active_session = connection._get_session() is not None
-            if not filter and set(kwargs) <= {"max_time_ms"} and not is_active_session:
-                # when no filter is provided, estimated_document_count
-                # is a lot faster as it uses the collection metadata
-                return collection.estimated_document_count(**kwargs)
-            else:
-                return collection.count_documents(
-                    filter=filter, session=connection._get_session(), **kwargs
-                )
-        except OperationFailure as err:
-            if PYMONGO_VERSION >= (4,):
-                raise
-
-            # OperationFailure - accounts for some operators that used to work
-            # with .count but are no longer working with count_documents (i.e $geoNear, $near, and $nearSphere)
-            # fallback to deprecated Cursor.count
-            # Keeping this should be reevaluated the day pymongo removes .count entirely
-            if (
-                "$geoNear, $near, and $nearSphere are not allowed in this context"
-                not in str(err)
-                and "$where is not allowed in this context" not in str(err)
-            ):
-                raise
 
+def _cursor_count(collection, filter, kwargs):
+    """Count with the deprecated Cursor.count"""
     cursor = collection.find(filter)
     for option, option_value in kwargs.items():
         cursor_method = getattr(cursor, option)
@@ -72,14 +72,68 @@ def count_documents(
     return cursor.count(with_limit_and_skip=with_limit_and_skip)
 
 
-def list_collection_names(db, include_system_collections=False):
-    """Pymongo>3.7 deprecates collection_names in favour of list_collection_names"""
-    if PYMONGO_VERSION >= (3, 7):
-        collections = db.list_collection_names(session=connection._get_session())
-    else:
-        collections = db.collection_names(session=connection._get_session())
+def _count_with_options(collection, filter, kwargs):
+    """Count with count_documents, or estimated_document_count when possible"""
+    session = connection._get_session()
 
-    if not include_system_collections:
-        collections = [c for c in collections if not c.startswith("system.")]
+    if not filter and kwargs.keys() <= _ALLOWED_EST_KEYS and session is None:
+        # when no filter is provided, estimated_document_count
+        # is a lot faster as it uses the collection metadata
+        return collection.estimated_document_count(**kwargs)
+    return collection.count_documents(filter=filter, session=session, **kwargs)
 
-    return collections
+
+def _count_documents_modern(
+    collection, filter, skip=None, limit=None, hint=None, collation=None
+):
+    """Pymongo>3.7 deprecates count in favour of count_documents"""
+    if limit == 0:
+        return 0  # Pymongo raises an OperationFailure if called with limit=0
+
+    kwargs = _get_count_kwargs(skip=skip, limit=limit, hint=hint, collation=collation)
+    return _count_with_options(collection, filter, kwargs)
+
+
+def _legacy_count_fallback(err, collection, filter, kwargs):
+    """Count with Cursor.count if count_documents failed with an operator
+    that is only supported by the deprecated count, re-raise otherwise.
+    """
+    # OperationFailure - accounts for some operators that used to work
+    # with .count but are no longer working with count_documents (i.e $geoNear, $near, and $nearSphere)
+    # fallback to deprecated Cursor.count
+    # Keeping this should be reevaluated the day pymongo removes .count entirely
+    err_msg = str(err)
+    if not any(msg in err_msg for msg in _COUNT_FALLBACK_MSGS):
+        raise err
+    return _cursor_count(collection, filter, kwargs)
+
+
+def _count_documents_pymongo3(
+    collection, filter, skip=None, limit=None, hint=None, collation=None
+):
+    """Pymongo 3.x still provides Cursor.count to fall back on"""
+    if limit == 0:
+        return 0  # Pymongo raises an OperationFailure if called with limit=0
+
+    kwargs = _get_count_kwargs(skip=skip, limit=limit, hint=hint, collation=collation)
+    try:
+        return _count_with_options(collection, filter, kwargs)
+    except OperationFailure as err:
+        return _legacy_count_fallback(err, collection, filter, kwargs)
+
+
+# Pick the implementation once, at import time, rather than on every call
+if _PYMONGO_GE_40:
+    count_documents = _count_documents_modern
+else:
+    count_documents = _count_documents_pymongo3
+
+
+def list_collection_names(db, include_system_collections=False):
+    """Pymongo>3.7 deprecates collection_names in favour of list_collection_names"""
+    session = connection._get_session()
+    if include_system_collections:
+        return db.list_collection_names(session=session)
+    return db.list_collection_names(
+        session=session, filter=_NON_SYSTEM_COLLECTIONS_FILTER
+    )
@@ -1546,10 +1546,9 @@ class BaseQuerySet:
         if queryset._ordering:
             docs = docs.sort(queryset._ordering)
 
+        document, collection = queryset._document, queryset._collection
         for doc in docs:
-            yield MapReduceDocument(
-                queryset._document, queryset._collection, doc["_id"], doc["value"]
-            )
+            yield MapReduceDocument(document, collection, doc["_id"], doc["value"])
 
     def exec_js(self, code, *fields, **options):
         """Execute a Javascript function on the server. A list of fields may be
@@ -20,15 +20,16 @@ class QueryFieldList:
         """
         self.value = value
         self.fields = set(fields or [])
-        self.always_include = set(always_include or [])
+        self.always_include = frozenset(always_include or ())
         self._id = None
         self._only_called = _only_called
         self.slice = {}
 
     def __add__(self, f):
+        # The fields set and slice dict are never updated in place as they may
+        # be shared with the QueryFieldList of another (shallow copied) queryset
         if isinstance(f.value, dict):
-            for field in f.fields:
-                self.slice[field] = f.value
+            self.slice = {**self.slice, **dict.fromkeys(f.fields, f.value)}
             if not self.fields:
                 self.fields = f.fields
         elif not self.fields:
@@ -38,14 +39,14 @@ class QueryFieldList:
         elif self.value is self.ONLY and f.value is self.ONLY:
             self._clean_slice()
             if self._only_called:
-                self.fields = self.fields.union(f.fields)
+                self.fields = self.fields | f.fields
             else:
                 self.fields = f.fields
         elif self.value is self.EXCLUDE and f.value is self.EXCLUDE:
-            self.fields = self.fields.union(f.fields)
+            self.fields = self.fields | f.fields
             self._clean_slice()
         elif self.value is self.ONLY and f.value is self.EXCLUDE:
-            self.fields -= f.fields
+            self.fields = self.fields - f.fields
             self._clean_slice()
         elif self.value is self.EXCLUDE and f.value is self.ONLY:
             self.value = self.ONLY
@@ -57,10 +58,10 @@ class QueryFieldList:
 
         if self.always_include:
             if self.value is self.ONLY and self.fields:
-                if sorted(self.slice.keys()) != sorted(self.fields):
-                    self.fields = self.fields.union(self.always_include)
+                if self.slice.keys() != self.fields:
+                    self.fields = self.fields | self.always_include
             else:
-                self.fields -= self.always_include
+                self.fields = self.fields - self.always_include
 
         if getattr(f, "_only_called", False):
             self._only_called = True
@@ -84,5 +85,4 @@ class QueryFieldList:
 
     def _clean_slice(self):
         if self.slice:
-            for field in set(self.slice.keys()) - self.fields:
-                del self.slice[field]
+            self.slice = {k: v for k, v in self.slice.items() if k in self.fields}
@@ -1,3 +1,4 @@
+import copy
 import unittest
 
 import pytest
@@ -60,6 +61,22 @@ class TestQueryFieldList:
         q += QueryFieldList(fields=["b", "c"], value=QueryFieldList.ONLY)
         assert q.as_dict() == {"x": 1, "y": 1, "b": 1, "c": 1}
 
+    def test_merge_does_not_alter_shallow_copies(self):
+        q = QueryFieldList(always_include=["x"])
+        q += QueryFieldList(fields=["a", "b"], value=QueryFieldList.ONLY)
+        q_copy = copy.copy(q)
+        q_copy += QueryFieldList(fields=["b"], value=QueryFieldList.EXCLUDE)
+        assert q.as_dict() == {"a": 1, "b": 1, "x": 1}
+        assert q_copy.as_dict() == {"a": 1, "x": 1}
+
+        q = QueryFieldList()
+        q += QueryFieldList(fields=["a", "c"], value=QueryFieldList.ONLY)
+        q += QueryFieldList(fields=["c"], value={"$slice": 5})
+        q_copy = copy.copy(q)
+        q_copy += QueryFieldList(fields=["c"], value=QueryFieldList.EXCLUDE)
+        assert q.as_dict() == {"a": 1, "c": {"$slice": 5}}
+        assert q_copy.as_dict() == {"a": 1}
+
     def test_using_a_slice(self):
         q = QueryFieldList()
         q += QueryFieldList(fields=["a"], value={"$slice": 5})
@@ -18,9 +18,10 @@ class TestFindAndModify(unittest.TestCase):
     def setUp(self):
         connect(db="mongoenginetest")
         Doc.drop_collection()
+        self._coll = Doc._get_collection()
 
     def _assert_db_equal(self, docs):
-        assert list(Doc._collection.find().sort("id")) == docs
+        assert list(self._coll.find().sort("id")) == docs
 
     def test_modify(self):
         Doc(id=0, value=0).save()
@@ -78,10 +79,11 @@ class TestFindAndModify(unittest.TestCase):
         self._assert_db_equal([{"_id": 0, "value": 0}])
 
     def test_modify_with_order_by(self):
-        Doc(id=0, value=3).save()
-        Doc(id=1, value=2).save()
-        Doc(id=2, value=1).save()
-        doc = Doc(id=3, value=0).save()
+        doc = Doc(id=3, value=0)
+        Doc.objects.insert(
+            [Doc(id=0, value=3), Doc(id=1, value=2), Doc(id=2, value=1), doc],
+            load_bulk=False,
+        )
 
         old_doc = Doc.objects().order_by("-id").modify(set__value=-1)
         assert old_doc.to_json() == doc.to_json()
@@ -95,8 +97,7 @@ class TestFindAndModify(unittest.TestCase):
         )
 
     def test_modify_with_fields(self):
-        Doc(id=0, value=0).save()
-        Doc(id=1, value=1).save()
+        Doc.objects.insert([Doc(id=0, value=0), Doc(id=1, value=1)], load_bulk=False)
 
         old_doc = Doc.objects(id=1).only("id").modify(set__value=-1)
         assert old_doc.to_mongo() == {"_id": 1}
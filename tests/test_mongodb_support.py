@@ -0,0 +1,81 @@
+import unittest
+from unittest import mock
+
+import pytest
+
+from mongoengine import connect, disconnect, disconnect_all
+from mongoengine.mongodb_support import (
+    _MONGODB_VERSION_CACHE,
+    get_cached_mongodb_version,
+    get_mongodb_version,
+)
+
+try:
+    import mongomock
+
+    MONGOMOCK_INSTALLED = True
+except ImportError:
+    MONGOMOCK_INSTALLED = False
+
+require_mongomock = pytest.mark.skipif(
+    not MONGOMOCK_INSTALLED, reason="you need mongomock installed to run this testcase"
+)
+
+
+class TestMongoDBSupport(unittest.TestCase):
+    def setUp(self):
+        disconnect_all()
+
+    def tearDown(self):
+        disconnect_all()
+
+    @require_mongomock
+    def test_get_mongodb_version_is_cached_per_alias(self):
+        conn = connect(
+            "mongoenginetest",
+            alias="version_cache",
+            mongo_client_class=mongomock.MongoClient,
+        )
+        version = get_mongodb_version("version_cache")
+        assert version == tuple(conn.server_info()["versionArray"][:2])
+        assert _MONGODB_VERSION_CACHE["version_cache"] == version
+
+        _MONGODB_VERSION_CACHE["version_cache"] = (1, 0)
+        assert get_mongodb_version("version_cache") == (1, 0)
+
+        disconnect("version_cache")
+        assert "version_cache" not in _MONGODB_VERSION_CACHE
+
+    @require_mongomock
+    def test_get_cached_mongodb_version(self):
+        connect(
+            "mongoenginetest",
+            alias="version_cache",
+            mongo_client_class=mongomock.MongoClient,
+        )
+        assert get_cached_mongodb_version("version_cache") is None
+
+        version = get_mongodb_version("version_cache")
+        assert get_cached_mongodb_version("version_cache") == version
+
+        disconnect("version_cache")
+        assert get_cached_mongodb_version("version_cache") is None
+
+    @require_mongomock
+    def test_get_mongodb_version_is_shared_by_aliases_of_a_same_client(self):
+        conn = connect(
+            "mongoenginetest",
+            alias="version_cache",
+            mongo_client_class=mongomock.MongoClient,
+        )
+        version = get_mongodb_version("version_cache")
+
+        conn2 = connect(
+            "mongoenginetest",
+            alias="version_cache2",
+            mongo_client_class=mongomock.MongoClient,
+        )
+        assert conn2 is conn
+        with mock.patch.object(conn, "server_info") as server_info:
+            assert get_mongodb_version("version_cache2") == version
+        server_info.assert_not_called()
@@ -1,5 +1,8 @@
 from mongoengine import Document
-from mongoengine.pymongo_support import count_documents
+from mongoengine.pymongo_support import (
+    count_documents,
+    list_collection_names,
+)
 from tests.utils import MongoDBTestCase
 
 
@@ -14,3 +17,19 @@ class TestPymongoSupport(MongoDBTestCase):
         assert count_documents(Test._get_collection(), filter={}) == 2
         assert count_documents(Test._get_collection(), filter={}, skip=1) == 1
         assert count_documents(Test._get_collection(), filter={}, limit=0) == 0
+
+    def test_list_collection_names(self):
+        class Test(Document):
+            pass
+
+        Test.drop_collection()
+        Test().save()
+        self.db.system.js.insert_one({"_id": "func", "value": "function() {}"})
+
+        collections = list_collection_names(self.db)
+        assert isinstance(collections, list)
+        assert "test" in collections
+        assert "system.js" not in collections
+        assert "system.js" in list_collection_names(
+            self.db, include_system_collections=True
+        )